@@ -1,13 +1,18 @@
 import logging
+import os
 from typing import List
-import pandas as pd
+import numpy as np
 import joblib
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from xgboost import XGBClassifier
 from challenge.model import DelayModel  
+from challenge.prediction_table import PredictionTable
+from challenge.batcher import MicroBatcher
+from challenge.streaming import stream_predictions
 
 # Configuración de Logging
 logging.basicConfig(
@@ -62,6 +67,48 @@ model._fitted_columns = joblib.load(model._columns_path)
 model._scaler = joblib.load(model._scaler_path)
 logger.info(f"✅ Columnas cargadas desde {model._columns_path} y scaler desde {model._scaler_path}")
 
+# Backend de scoring (SCORING_BACKEND=xgboost|compiled)
+model.set_scoring_backend(os.getenv('SCORING_BACKEND', 'xgboost'))
+
+# ----------------------------------------------------------------
+# Tabla de predicciones precalculadas (opcional, PREDICTION_TABLE=true)
+# ----------------------------------------------------------------
+prediction_table = None
+if os.getenv('PREDICTION_TABLE', 'false').lower() in ('1', 'true', 'yes'):
+    prediction_table = PredictionTable(model).build()
+    prediction_table.verify()
+
+
+def _score_flights(flights_list: List[dict]) -> List[int]:
+    """
+    Predicción para una lista de vuelos: tabla precalculada si está activa,
+    si no encode + predict.
+    """
+    # Modo tabla: búsquedas en diccionario con fallback al pipeline completo
+    if prediction_table is not None:
+        return prediction_table.predict(flights_list)
+
+    # Codificación en modo inferencia (matriz float32, sin DataFrames)
+    features = model.encode(flights_list)
+    logger.info(f"🔄 Datos preprocesados: {features}")
+
+    # Predicción
+    preds = model.predict(features)
+    logger.info(f"🔄 Predicciones realizadas: {preds}")
+    return np.asarray(preds).tolist()
+
+
+# ----------------------------------------------------------------
+# Micro-batching de requests concurrentes (opcional, MICRO_BATCHING=true)
+# ----------------------------------------------------------------
+batcher = None
+if os.getenv('MICRO_BATCHING', 'false').lower() in ('1', 'true', 'yes'):
+    batcher = MicroBatcher(
+        _score_flights,
+        max_batch_size=int(os.getenv('MICRO_BATCH_MAX_SIZE', '256')),
+        max_wait_ms=float(os.getenv('MICRO_BATCH_MAX_WAIT_MS', '2'))
+    )
+
 # ----------------------------------------------------------------
 # Endpoint de Salud
 # ----------------------------------------------------------------
@@ -72,6 +119,20 @@ async def get_health() -> dict:
     """
     return {"status": "OK", "detail": "your request was received"}
 
+
+@app.get("/stats", status_code=200)
+async def get_stats() -> dict:
+    """
+    Métricas del micro-batcher (tamaño de batch y espera en cola).
+    """
+    return {"micro_batching": batcher.stats() if batcher is not None else None}
+
+
+@app.on_event("shutdown")
+async def shutdown_batcher() -> None:
+    if batcher is not None:
+        await batcher.close()
+
 # ----------------------------------------------------------------
 # Endpoint de Predicción
 # ----------------------------------------------------------------
@@ -104,24 +165,51 @@ async def post_predict(request: FlightRequest) -> dict:
     """
     try:
         flights_list = [flight.dict() for flight in request.flights]
-        df_inference = pd.DataFrame(flights_list)
-        logger.info(f"🔄 Datos de inferencia recibidos: {df_inference}")
+        logger.info(f"🔄 Datos de inferencia recibidos: {flights_list}")
 
-        # Preprocesamiento en modo inferencia
-        df_processed = model.preprocess(
-            df_inference,
-            fit=False,
-            is_training=False
-        )
-        logger.info(f"🔄 Datos preprocesados: {df_processed}")
-
-        # Predicción
-        preds = model._model.predict(df_processed)
-        logger.info(f"🔄 Predicciones realizadas: {preds}")
+        # Con micro-batching, los vuelos se evalúan junto a los de otros requests
+        if batcher is not None:
+            preds = await batcher.submit(flights_list)
+        else:
+            preds = _score_flights(flights_list)
 
         # Retornar respuesta
-        return {"predict": preds.tolist()}
+        return {"predict": preds}
 
     except Exception as e:
         logger.error(f"❌ Error en /predict: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# ----------------------------------------------------------------
+# Endpoint de Predicción en streaming (NDJSON)
+# ----------------------------------------------------------------
+STREAM_CHUNK_SIZE = int(os.getenv('STREAM_CHUNK_SIZE', '1000'))
+
+
+@app.post("/predict/stream", status_code=200)
+async def post_predict_stream(request: Request) -> StreamingResponse:
+    """
+    Predicción masiva en streaming. El body es NDJSON con un vuelo por línea
+    y la respuesta es NDJSON con una línea por vuelo, en el mismo orden.
+    Los vuelos se evalúan en bloques de STREAM_CHUNK_SIZE a medida que
+    llegan, así que la memoria no depende del tamaño del input.
+
+    **Ejemplo de Payload:**
+
+    ```
+    {"OPERA": "Aerolineas Argentinas", "TIPOVUELO": "N", "MES": 3}
+    {"OPERA": "Grupo LATAM", "TIPOVUELO": "I", "MES": 7}
+    ```
+
+    **Respuesta Exitosa:**
+
+    ```
+    {"line": 1, "predict": 0}
+    {"line": 2, "predict": 1}
+    ```
+    """
+    return StreamingResponse(
+        stream_predictions(request.stream(), Flight, _score_flights, chunk_size=STREAM_CHUNK_SIZE),
+        media_type="application/x-ndjson"
+    )
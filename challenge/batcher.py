@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+ScoreFn = Callable[[List[dict]], Sequence[int]]
+
+# Límites superiores (inclusive) de los buckets del histograma de tamaño de batch
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+class MicroBatcher:
+    """
+    Micro-batcher asyncio: junta los vuelos de requests concurrentes en una
+    sola llamada al modelo, acotada por max_batch_size (vuelos) y por
+    max_wait_ms desde que llega el primer request del batch. Luego reparte
+    las predicciones a cada request en el mismo orden.
+
+    Un request más grande que max_batch_size se evalúa solo, sin partirlo.
+    """
+
+    def __init__(self, score_fn: ScoreFn, max_batch_size: int = 256, max_wait_ms: float = 2.0):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size debe ser >= 1")
+        self._score_fn = score_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._carry: Optional[Tuple[List[dict], asyncio.Future, float]] = None
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self._stats = {
+            'batches': 0,
+            'requests': 0,
+            'flights': 0,
+            'errors': 0,
+            'batch_size_buckets': {bucket: 0 for bucket in BATCH_SIZE_BUCKETS + (float('inf'),)},
+            'queue_wait_ms_sum': 0.0,
+            'queue_wait_ms_max': 0.0,
+        }
+
+    def stats(self) -> dict:
+        """
+        Métricas acumuladas: tamaño de batch (histograma acumulado por
+        límite superior) y espera en cola por request.
+        """
+        stats = dict(self._stats)
+        cumulative, buckets = 0, {}
+        for bound, count in self._stats['batch_size_buckets'].items():
+            cumulative += count
+            buckets['+Inf' if bound == float('inf') else str(bound)] = cumulative
+        stats['batch_size_buckets'] = buckets
+        stats['mean_batch_size'] = stats['flights'] / stats['batches'] if stats['batches'] else 0.0
+        stats['mean_queue_wait_ms'] = stats['queue_wait_ms_sum'] / stats['requests'] if stats['requests'] else 0.0
+        return stats
+
+    def _ensure_worker(self) -> None:
+        # El worker vive en el event loop actual; si el loop cambió (p. ej. en
+        # tests que crean un loop por request) se crea uno nuevo.
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._carry = None
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, flights: List[dict]) -> List[int]:
+        """
+        Encola los vuelos de un request y espera sus predicciones.
+        """
+        if not flights:
+            return []
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((flights, future, time.perf_counter()))
+        return await future
+
+    async def close(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    async def _next_batch(self) -> List[Tuple[List[dict], asyncio.Future, float]]:
+        first = self._carry or await self._queue.get()
+        self._carry = None
+        batch, size = [first], len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+
+        while size < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if size + len(item[0]) > self.max_batch_size:
+                # No cabe: abre el siguiente batch
+                self._carry = item
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            started = time.perf_counter()
+            flights = [flight for item in batch for flight in item[0]]
+            self._record(batch, len(flights), started)
+
+            try:
+                preds = list(self._score_fn(flights))
+            except Exception as e:
+                self._stats['errors'] += 1
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_flights, future, _ in batch:
+                if not future.done():
+                    future.set_result(preds[offset:offset + len(request_flights)])
+                offset += len(request_flights)
+
+    def _record(self, batch, n_flights: int, started: float) -> None:
+        stats = self._stats
+        stats['batches'] += 1
+        stats['requests'] += len(batch)
+        stats['flights'] += n_flights
+        for bound in stats['batch_size_buckets']:
+            if n_flights <= bound:
+                stats['batch_size_buckets'][bound] += 1
+                break
+        for _, _, enqueued in batch:
+            wait_ms = (started - enqueued) * 1000
+            stats['queue_wait_ms_sum'] += wait_ms
+            stats['queue_wait_ms_max'] = max(stats['queue_wait_ms_max'], wait_ms)
@@ -0,0 +1,76 @@
+import logging
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+logger = logging.getLogger(__name__)
+
+CATEGORICAL_COLUMNS = ['OPERA', 'TIPOVUELO', 'MES']
+
+Records = Union[Sequence[dict], Mapping[str, Sequence]]
+
+
+class InferenceEncoder:
+    """
+    Codificador de inferencia compilado a partir de las columnas ajustadas
+    y del scaler. Convierte OPERA/TIPOVUELO/MES directamente en una matriz
+    float32 con el escalado ya aplicado: cada feature one-hot solo puede
+    valer 0 ó 1, así que se precalculan sus dos valores escalados.
+
+    Equivale a preprocess(fit=False): get_dummies + reindex + scaler.transform.
+    """
+
+    def __init__(self, columns: Sequence[str], scaler: StandardScaler, dtype=np.float32):
+        self._columns = list(columns)
+        self._dtype = dtype
+
+        n_features = len(self._columns)
+        mean = getattr(scaler, 'mean_', None)
+        scale = getattr(scaler, 'scale_', None)
+        mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64)
+        scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+
+        # Mismo cálculo en float64 que StandardScaler.transform, luego se castea
+        self._off = ((0.0 - mean) / scale).astype(dtype)
+        self._on = ((1.0 - mean) / scale).astype(dtype)
+
+        # Columna categórica -> [(índice de la feature, categoría)], con el
+        # nombre que get_dummies le da a cada dummy ('MES_7' -> MES == 7)
+        self._categories: Dict[str, List[Tuple[int, str]]] = {col: [] for col in CATEGORICAL_COLUMNS}
+        for j, feature in enumerate(self._columns):
+            for col in CATEGORICAL_COLUMNS:
+                if feature.startswith(f'{col}_'):
+                    self._categories[col].append((j, feature[len(col) + 1:]))
+                    break
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def transform(self, data: Records) -> np.ndarray:
+        """
+        Codifica una lista de vuelos (dicts) o un mapping columna -> valores
+        (dict de listas/arrays o DataFrame) en una matriz (n, n_features).
+        """
+        if isinstance(data, Mapping) or hasattr(data, 'columns'):
+            columns = {col: data[col] for col in CATEGORICAL_COLUMNS if col in data}
+            n_rows = len(data) if hasattr(data, 'columns') else len(next(iter(data.values()), []))
+        else:
+            n_rows = len(data)
+            columns = {
+                col: [flight[col] for flight in data]
+                for col in CATEGORICAL_COLUMNS
+                if n_rows and col in data[0]
+            }
+
+        out = np.empty((n_rows, len(self._columns)), dtype=self._dtype)
+        out[:] = self._off
+        for col, values in columns.items():
+            categories = self._categories[col]
+            if not categories:
+                continue
+            tokens = np.asarray(values).astype(str)
+            for j, category in categories:
+                out[tokens == category, j] = self._on[j]
+        return out
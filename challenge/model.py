@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import logging
 from typing import Tuple, Union, List, Optional
@@ -15,11 +16,11 @@ import joblib
 # Para early stopping
 from sklearn.model_selection import StratifiedKFold
 
+from challenge.encoder import InferenceEncoder, Records
+from challenge.tree_evaluator import CompiledBooster
 from utils.utils import (
-    get_period_day,
-    is_high_season,
-    get_min_diff,
-    delay
+    date_features,
+    delay_array
 )
 
 # Logging Configuration
@@ -43,16 +44,25 @@ IMPORTANT_FEATURES = [
     'OPERA_Copa Air'
 ]
 
+# Backends de scoring disponibles para DelayModel.predict
+SCORING_BACKENDS = ('xgboost', 'compiled')
+
 class DelayModel:
     def __init__(
         self, 
         important_features: Optional[List[str]] = None,
         model_path: str = 'challenge/delay_model.json',   # Se guarda en JSON (XGBoost)
         columns_path: str = 'challenge/fitted_columns.pkl',
-        scaler_path: str = 'challenge/scaler.pkl'
+        scaler_path: str = 'challenge/scaler.pkl',
+        scoring_backend: str = 'xgboost',
+        compiled_max_rows: int = 32
     ):
         """
         Constructor por defecto. 
+
+        - scoring_backend='compiled' evalúa los batches de hasta
+          compiled_max_rows filas con el evaluador de árboles compilado
+          (CompiledBooster); los batches más grandes siguen usando XGBoost.
         """
         self._model = XGBClassifier(
             random_state=42,
@@ -61,6 +71,8 @@ class DelayModel:
         self._scaler = StandardScaler()
         self._important_features = important_features or IMPORTANT_FEATURES
         self._fitted_columns = None
+        self._encoder = None
+        self.set_scoring_backend(scoring_backend, compiled_max_rows)
         self._model_json_path = model_path
         self._columns_path = columns_path
         self._scaler_path = scaler_path
@@ -74,9 +86,14 @@ class DelayModel:
         a partir de 'Fecha-I'. Se asume que 'Fecha-I' existe.
         """
         logger.info("🔄 Generating date-based features...")
-        data['period_day'] = data['Fecha-I'].apply(get_period_day)
-        data['high_season'] = data['Fecha-I'].apply(is_high_season)
-        data['min_diff'] = data.apply(get_min_diff, axis=1)
+        # Fecha-I y Fecha-O se parsean una sola vez y el resto es aritmética de arrays
+        features = date_features(
+            data['Fecha-I'],
+            data['Fecha-O'] if 'Fecha-O' in data.columns else None
+        )
+        data['period_day'] = features['period_day'].to_numpy()
+        data['high_season'] = features['high_season'].to_numpy()
+        data['min_diff'] = features['min_diff'].to_numpy()
         logger.info("✅ Date-based features generated successfully.")
         return data
 
@@ -85,7 +102,7 @@ class DelayModel:
         Crea la columna 'delay' a partir de 'min_diff' (0/1).
         Esto se usa en entrenamiento para definir el target.
         """
-        data['delay'] = data['min_diff'].apply(lambda x: delay(x, threshold=threshold))
+        data['delay'] = delay_array(data['min_diff'], threshold=threshold)
         return data
 
     # ----------------------------------------------------------------
@@ -127,10 +144,12 @@ class DelayModel:
             data.drop(columns=[target_column], inplace=True)
             logger.info("✅ Data preprocessed successfully with target column.")
 
-        # One-hot encoding de las col. categóricas que existan
+        # One-hot encoding de las col. categóricas que existan.
+        # En inferencia no se usa drop_first: cada fila debe codificarse
+        # igual sin importar qué otros vuelos vengan en el mismo batch.
         categorical_columns = ['OPERA', 'TIPOVUELO', 'MES']
         existing_cat_cols = [col for col in categorical_columns if col in data.columns]
-        data = pd.get_dummies(data, columns=existing_cat_cols, drop_first=True)
+        data = pd.get_dummies(data, columns=existing_cat_cols, drop_first=fit)
 
         # Reindex con las features importantes
         data = data.reindex(columns=self._important_features, fill_value=0)
@@ -138,6 +157,7 @@ class DelayModel:
         # Escalado
         if fit:
             self._fitted_columns = data.columns
+            self._encoder = None
             data = pd.DataFrame(
                 self._scaler.fit_transform(data),
                 columns=self._fitted_columns
@@ -158,6 +178,59 @@ class DelayModel:
         else:
             return data
 
+    # ----------------------------------------------------------------
+    # Codificación rápida para inferencia (sin pandas)
+    # ----------------------------------------------------------------
+    def get_encoder(self) -> InferenceEncoder:
+        """
+        Compila (una vez) el codificador de inferencia a partir de las
+        columnas ajustadas y el scaler.
+        """
+        if self._fitted_columns is None:
+            raise ValueError("Preprocessing pipeline has not been fitted yet.")
+        if self._encoder is None:
+            self._encoder = InferenceEncoder(self._fitted_columns, self._scaler)
+        return self._encoder
+
+    def encode(self, data: Records) -> np.ndarray:
+        """
+        Equivalente a preprocess(fit=False) pero devuelve directamente una
+        matriz float32, sin construir DataFrames. Acepta una lista de vuelos
+        (dicts), un dict de columnas o un DataFrame con OPERA/TIPOVUELO/MES.
+        """
+        return self.get_encoder().transform(data)
+
+    # ----------------------------------------------------------------
+    # Scoring
+    # ----------------------------------------------------------------
+    def set_scoring_backend(self, backend: str, compiled_max_rows: Optional[int] = None) -> None:
+        """
+        Selecciona el backend de predict(): 'xgboost' o 'compiled'.
+        """
+        if backend not in SCORING_BACKENDS:
+            raise ValueError(f"Backend de scoring desconocido: {backend}. Opciones: {SCORING_BACKENDS}")
+        self._scoring_backend = backend
+        if compiled_max_rows is not None:
+            self._compiled_max_rows = compiled_max_rows
+        self._compiled = None
+
+    def get_compiled(self) -> CompiledBooster:
+        """
+        Compila (una vez) los árboles del booster actual a arrays de NumPy.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledBooster.from_booster(self._model.get_booster())
+            logger.info(f"✅ Booster compilado: {self._compiled.n_trees} árboles")
+        return self._compiled
+
+    def predict(self, features: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        Predice 0/1 con el backend configurado.
+        """
+        if self._scoring_backend == 'compiled' and len(features) <= self._compiled_max_rows:
+            return self.get_compiled().predict(features)
+        return self._model.predict(features)
+
     # ----------------------------------------------------------------
     # Entrenamiento (fit)
     # ----------------------------------------------------------------
@@ -221,6 +294,7 @@ class DelayModel:
             X_train, y_train,
             eval_set=[(X_val, y_val)]
         )
+        self._compiled = None
 
         # Guardar modelo en JSON
         self._model.save_model(self._model_json_path)
@@ -0,0 +1,121 @@
+import itertools
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from challenge.model import DelayModel
+
+logger = logging.getLogger(__name__)
+
+# Dominio conocido de las columnas categóricas que recibe /predict
+FLIGHT_TYPES = ('I', 'N')
+MONTHS = tuple(range(1, 13))
+
+FlightKey = Tuple[str, str, int]
+
+
+def flight_key(flight: dict) -> FlightKey:
+    """
+    Normaliza un vuelo (dict con OPERA, TIPOVUELO, MES) a la llave de la tabla.
+    """
+    return (str(flight['OPERA']), str(flight['TIPOVUELO']), int(flight['MES']))
+
+
+def known_airlines(model: DelayModel) -> List[str]:
+    """
+    Aerolíneas que el modelo distingue, según las columnas ajustadas.
+    """
+    columns = model._fitted_columns if model._fitted_columns is not None else model._important_features
+    return [col[len('OPERA_'):] for col in columns if col.startswith('OPERA_')]
+
+
+class PredictionTable:
+    """
+    Tabla precalculada con la predicción de cada combinación
+    OPERA x TIPOVUELO x MES conocida. Los vuelos fuera de la tabla
+    se resuelven con el pipeline completo (preprocess + predict).
+    """
+
+    def __init__(
+        self,
+        model: DelayModel,
+        airlines: Optional[Sequence[str]] = None,
+        flight_types: Sequence[str] = FLIGHT_TYPES,
+        months: Sequence[int] = MONTHS
+    ):
+        self._model = model
+        self._airlines = list(airlines) if airlines is not None else known_airlines(model)
+        self._flight_types = list(flight_types)
+        self._months = list(months)
+        self._table: Dict[FlightKey, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, key: FlightKey) -> bool:
+        return key in self._table
+
+    def _score(self, flights: List[dict]) -> List[int]:
+        """
+        Pipeline de inferencia: encode -> predict.
+        """
+        features = self._model.encode(flights)
+        return [int(pred) for pred in self._model.predict(features)]
+
+    def _score_reference(self, flights: List[dict]) -> List[int]:
+        """
+        Pipeline de referencia con pandas: DataFrame -> preprocess -> predict.
+        """
+        data = pd.DataFrame(flights, columns=['OPERA', 'TIPOVUELO', 'MES'])
+        features = self._model.preprocess(data, fit=False, is_training=False)
+        return [int(pred) for pred in self._model._model.predict(features)]
+
+    def build(self) -> 'PredictionTable':
+        """
+        Enumera todas las combinaciones conocidas y las evalúa
+        en una sola llamada al modelo.
+        """
+        keys = list(itertools.product(self._airlines, self._flight_types, self._months))
+        flights = [{'OPERA': opera, 'TIPOVUELO': tipo, 'MES': mes} for opera, tipo, mes in keys]
+        preds = self._score(flights)
+        self._table = dict(zip(keys, preds))
+        logger.info(f"✅ Tabla de predicciones construida con {len(self._table)} combinaciones")
+        return self
+
+    def verify(self) -> None:
+        """
+        Verifica que cada entrada de la tabla coincida exactamente con
+        el pipeline de pandas evaluando cada vuelo por separado.
+        """
+        mismatches = []
+        for key, expected in self._table.items():
+            opera, tipo, mes = key
+            actual = self._score_reference([{'OPERA': opera, 'TIPOVUELO': tipo, 'MES': mes}])[0]
+            if actual != expected:
+                mismatches.append(key)
+        if mismatches:
+            raise ValueError(
+                f"La tabla de predicciones no coincide con el modelo en {len(mismatches)} combinaciones: {mismatches[:5]}"
+            )
+        logger.info("✅ Tabla de predicciones verificada contra el modelo")
+
+    def predict(self, flights: List[dict]) -> List[int]:
+        """
+        Responde con búsquedas en la tabla; los vuelos desconocidos
+        se evalúan juntos con el pipeline completo.
+        """
+        preds: List[Optional[int]] = [None] * len(flights)
+        misses = []
+        for i, flight in enumerate(flights):
+            pred = self._table.get(flight_key(flight))
+            if pred is None:
+                misses.append(i)
+            else:
+                preds[i] = pred
+
+        if misses:
+            fallback = self._score([flights[i] for i in misses])
+            for i, pred in zip(misses, fallback):
+                preds[i] = pred
+        return preds
@@ -0,0 +1,85 @@
+import json
+import logging
+from typing import AsyncIterator, Callable, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+ScoreFn = Callable[[List[dict]], Sequence[int]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    """
+    Parte un stream de bytes en líneas (número de línea desde 1, contenido),
+    guardando en memoria solo la línea incompleta del final.
+    """
+    buffer = b''
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            line_number += 1
+            yield line_number, line
+    if buffer:
+        yield line_number + 1, buffer
+
+
+def _dumps(record: dict) -> bytes:
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+async def stream_predictions(
+    chunks: AsyncIterator[bytes],
+    schema: Type[BaseModel],
+    score_fn: ScoreFn,
+    chunk_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """
+    Lee vuelos NDJSON (un objeto con OPERA, TIPOVUELO y MES por línea), los
+    evalúa en bloques de chunk_size a medida que llegan y emite, en el mismo
+    orden, una línea NDJSON por vuelo: {"line": n, "predict": 0|1} o
+    {"line": n, "error": "..."}. Las líneas vacías se ignoran.
+    """
+    # (número de línea, vuelo validado o None, error o None)
+    pending: List[Tuple[int, Optional[dict], Optional[str]]] = []
+    n_valid = 0
+
+    def flush() -> List[bytes]:
+        flights = [flight for _, flight, _ in pending if flight is not None]
+        try:
+            preds = iter(score_fn(flights)) if flights else iter(())
+            error = None
+        except Exception as e:
+            logger.error(f"❌ Error en /predict/stream: {e}")
+            preds, error = None, str(e)
+
+        out = []
+        for line_number, flight, line_error in pending:
+            if flight is None:
+                out.append(_dumps({"line": line_number, "error": line_error}))
+            elif error is not None:
+                out.append(_dumps({"line": line_number, "error": error}))
+            else:
+                out.append(_dumps({"line": line_number, "predict": int(next(preds))}))
+        pending.clear()
+        return out
+
+    async for line_number, line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            pending.append((line_number, schema.parse_raw(line).dict(), None))
+            n_valid += 1
+        except (ValidationError, ValueError) as e:
+            pending.append((line_number, None, str(e)))
+
+        if n_valid >= chunk_size:
+            for out in flush():
+                yield out
+            n_valid = 0
+
+    if pending:
+        for out in flush():
+            yield out
@@ -3,17 +3,18 @@ from unittest.mock import patch, MagicMock
 import numpy as np
 
 from fastapi.testclient import TestClient
-from challenge.api import app  # Asegúrate de que la ruta sea correcta
+from challenge.api import app, _score_flights  # Asegúrate de que la ruta sea correcta
+from challenge.batcher import MicroBatcher
 
 class TestAPIPredict(unittest.TestCase):
     def setUp(self):
         self.client = TestClient(app)
     
-    @patch('challenge.api.model.preprocess')
+    @patch('challenge.api.model.encode')
     @patch('challenge.api.model._model.predict')
-    def test_predict_success(self, mock_predict, mock_preprocess):
+    def test_predict_success(self, mock_predict, mock_encode):
         # Configurar el mock
-        mock_preprocess.return_value = MagicMock()
+        mock_encode.return_value = MagicMock()
         mock_predict.return_value = np.array([0])
         
         # Datos de prueba
@@ -32,14 +33,14 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.json(), {"predict": [0]})
         
         # Verificar que se llamó al preprocesamiento y predict
-        mock_preprocess.assert_called_once()
+        mock_encode.assert_called_once()
         mock_predict.assert_called_once()
     
-    @patch('challenge.api.model.preprocess')
+    @patch('challenge.api.model.encode')
     @patch('challenge.api.model._model.predict')
-    def test_predict_multiple_flights(self, mock_predict, mock_preprocess):
+    def test_predict_multiple_flights(self, mock_predict, mock_encode):
         # Configurar el mock
-        mock_preprocess.return_value = MagicMock()
+        mock_encode.return_value = MagicMock()
         mock_predict.return_value = np.array([0, 1])
         
         # Datos de prueba con múltiples vuelos
@@ -63,14 +64,14 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.json(), {"predict": [0, 1]})
         
         # Verificar que se llamó al preprocesamiento y predict
-        mock_preprocess.assert_called_once()
+        mock_encode.assert_called_once()
         mock_predict.assert_called_once()
     
-    @patch('challenge.api.model.preprocess')
+    @patch('challenge.api.model.encode')
     @patch('challenge.api.model._model.predict')
-    def test_predict_empty_flights(self, mock_predict, mock_preprocess):
+    def test_predict_empty_flights(self, mock_predict, mock_encode):
         # Configurar el mock
-        mock_preprocess.return_value = MagicMock()
+        mock_encode.return_value = MagicMock()
         mock_predict.return_value = np.array([])
         
         # Datos de prueba con lista de vuelos vacía
@@ -83,9 +84,62 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.json(), {"predict": []})
         
         # Verificar que se llamó al preprocesamiento y predict
-        mock_preprocess.assert_called_once()
+        mock_encode.assert_called_once()
         mock_predict.assert_called_once()
     
+    @patch('challenge.api.model.encode')
+    @patch('challenge.api.prediction_table')
+    def test_predict_prediction_table(self, mock_table, mock_encode):
+        # Con la tabla activa no se usa el pipeline de pandas
+        mock_table.predict.return_value = [1]
+
+        data = {
+            "flights": [
+                {
+                    "OPERA": "Grupo LATAM",
+                    "TIPOVUELO": "I",
+                    "MES": 7
+                }
+            ]
+        }
+
+        response = self.client.post("/predict", json=data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"predict": [1]})
+
+        mock_table.predict.assert_called_once_with(data["flights"])
+        mock_encode.assert_not_called()
+
+    @patch('challenge.api.model.encode')
+    @patch('challenge.api.model._model.predict')
+    def test_predict_micro_batching(self, mock_predict, mock_encode):
+        # Con micro-batching la respuesta es la misma
+        mock_encode.return_value = MagicMock()
+        mock_predict.return_value = np.array([1, 0])
+
+        data = {
+            "flights": [
+                {
+                    "OPERA": "Grupo LATAM",
+                    "TIPOVUELO": "I",
+                    "MES": 7
+                },
+                {
+                    "OPERA": "Sky Airline",
+                    "TIPOVUELO": "N",
+                    "MES": 3
+                }
+            ]
+        }
+
+        with patch('challenge.api.batcher', MicroBatcher(_score_flights, max_wait_ms=1)):
+            response = self.client.post("/predict", json=data)
+            stats = self.client.get("/stats").json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"predict": [1, 0]})
+        self.assertEqual(stats["micro_batching"]["flights"], 2)
+        mock_predict.assert_called_once()
+
     def test_health_endpoint(self):
         response = self.client.get("/health")
         self.assertEqual(response.status_code, 200)
@@ -107,11 +161,11 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.status_code, 422)  # Error de validación de Pydantic
         self.assertIn("value_error.missing", response.text)
     
-    @patch('challenge.api.model.preprocess')
+    @patch('challenge.api.model.encode')
     @patch('challenge.api.model._model.predict')
-    def test_predict_invalid_mes(self, mock_predict, mock_preprocess):
+    def test_predict_invalid_mes(self, mock_predict, mock_encode):
         # Configurar el mock para manejar MES inválido
-        mock_preprocess.side_effect = ValueError("MES inválido")
+        mock_encode.side_effect = ValueError("MES inválido")
         
         data = {
             "flights": [
@@ -127,11 +181,11 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.status_code, 500)
         self.assertEqual(response.json(), {"detail": "MES inválido"})
     
-    @patch('challenge.api.model.preprocess')
+    @patch('challenge.api.model.encode')
     @patch('challenge.api.model._model.predict')
-    def test_predict_invalid_tipovuelo(self, mock_predict, mock_preprocess):
+    def test_predict_invalid_tipovuelo(self, mock_predict, mock_encode):
         # Configurar el mock para manejar TIPOVUELO inválido
-        mock_preprocess.side_effect = ValueError("TIPOVUELO inválido")
+        mock_encode.side_effect = ValueError("TIPOVUELO inválido")
         
         data = {
             "flights": [
@@ -147,10 +201,10 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.status_code, 500)
         self.assertEqual(response.json(), {"detail": "TIPOVUELO inválido"})
     
-    @patch('challenge.api.model.preprocess')
-    def test_predict_preprocess_exception(self, mock_preprocess):
+    @patch('challenge.api.model.encode')
+    def test_predict_preprocess_exception(self, mock_encode):
         # Simular una excepción durante el preprocesamiento
-        mock_preprocess.side_effect = Exception("Error durante el preprocesamiento")
+        mock_encode.side_effect = Exception("Error durante el preprocesamiento")
         
         data = {
             "flights": [
@@ -166,11 +220,11 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.status_code, 500)
         self.assertEqual(response.json(), {"detail": "Error durante el preprocesamiento"})
     
-    @patch('challenge.api.model.preprocess')
+    @patch('challenge.api.model.encode')
     @patch('challenge.api.model._model.predict')
-    def test_predict_predict_exception(self, mock_predict, mock_preprocess):
+    def test_predict_predict_exception(self, mock_predict, mock_encode):
         # Configurar el mock para lanzar una excepción durante la predicción
-        mock_preprocess.return_value = MagicMock()
+        mock_encode.return_value = MagicMock()
         mock_predict.side_effect = Exception("Error durante la predicción")
         
         data = {
@@ -187,11 +241,11 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.status_code, 500)
         self.assertEqual(response.json(), {"detail": "Error durante la predicción"})
     
-    @patch('challenge.api.model.preprocess')
+    @patch('challenge.api.model.encode')
     @patch('challenge.api.model._model.predict')
-    def test_predict_unknown_opera(self, mock_predict, mock_preprocess):
+    def test_predict_unknown_opera(self, mock_predict, mock_encode):
         # Configurar el mock para manejar una OPERA desconocida
-        mock_preprocess.return_value = MagicMock()
+        mock_encode.return_value = MagicMock()
         mock_predict.return_value = np.array([0])
         
         data = {
@@ -208,7 +262,7 @@ class TestAPIPredict(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"predict": [0]})
         
-        mock_preprocess.assert_called_once()
+        mock_encode.assert_called_once()
         mock_predict.assert_called_once()
 
 if __name__ == '__main__':
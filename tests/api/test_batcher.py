@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+
+from challenge.batcher import MicroBatcher
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def score(flights):
+            self.calls.append(len(flights))
+            return [flight['MES'] for flight in flights]
+
+        self.score = score
+
+    def _flights(self, *months):
+        return [{'OPERA': 'Grupo LATAM', 'TIPOVUELO': 'N', 'MES': mes} for mes in months]
+
+    def test_concurrent_requests_are_merged(self):
+        """Concurrent requests share one model call and get their own results back."""
+        batcher = MicroBatcher(self.score, max_batch_size=100, max_wait_ms=20)
+
+        async def run():
+            results = await asyncio.gather(
+                batcher.submit(self._flights(1)),
+                batcher.submit(self._flights(2, 3)),
+                batcher.submit(self._flights(4)),
+            )
+            await batcher.close()
+            return results
+
+        results = asyncio.run(run())
+        self.assertEqual(results, [[1], [2, 3], [4]])
+        self.assertEqual(self.calls, [4])
+        stats = batcher.stats()
+        self.assertEqual(stats['batches'], 1)
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['batch_size_buckets']['4'], 1)
+
+    def test_max_batch_size(self):
+        """A batch never exceeds max_batch_size unless a single request does."""
+        batcher = MicroBatcher(self.score, max_batch_size=3, max_wait_ms=20)
+
+        async def run():
+            results = await asyncio.gather(
+                batcher.submit(self._flights(1, 2)),
+                batcher.submit(self._flights(3, 4)),
+                batcher.submit(self._flights(5, 6, 7, 8)),
+            )
+            await batcher.close()
+            return results
+
+        results = asyncio.run(run())
+        self.assertEqual(results, [[1, 2], [3, 4], [5, 6, 7, 8]])
+        self.assertEqual(self.calls, [2, 2, 4])
+
+    def test_errors_propagate(self):
+        """A failing model call fails every request in the batch."""
+        def fail(flights):
+            raise ValueError("boom")
+
+        batcher = MicroBatcher(fail, max_batch_size=10, max_wait_ms=5)
+
+        async def run():
+            results = await asyncio.gather(
+                batcher.submit(self._flights(1)),
+                batcher.submit(self._flights(2)),
+                return_exceptions=True
+            )
+            await batcher.close()
+            return results
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(batcher.stats()['errors'], 1)
+
+    def test_empty_request(self):
+        """An empty request is answered without calling the model."""
+        batcher = MicroBatcher(self.score)
+        self.assertEqual(asyncio.run(batcher.submit([])), [])
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from challenge.api import app, Flight
+from challenge.streaming import iter_lines, stream_predictions
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def score(flights):
+            self.calls.append(len(flights))
+            return [flight['MES'] % 2 for flight in flights]
+
+        self.score = score
+
+    def _run(self, *parts, chunk_size=2):
+        lines = asyncio.run(_collect(stream_predictions(_chunks(*parts), Flight, self.score, chunk_size)))
+        return [json.loads(line) for line in lines]
+
+    def test_iter_lines_across_chunks(self):
+        """Lines split across network chunks are reassembled."""
+        lines = asyncio.run(_collect(iter_lines(_chunks(b'{"a"', b': 1}\n{"b": 2}\n{"c"', b': 3}'))))
+        self.assertEqual(lines, [(1, b'{"a": 1}'), (2, b'{"b": 2}'), (3, b'{"c": 3}')])
+
+    def test_chunked_scoring(self):
+        """Flights are scored in fixed-size chunks and answered in order."""
+        body = b''.join(
+            json.dumps({"OPERA": "Grupo LATAM", "TIPOVUELO": "N", "MES": mes}).encode() + b'\n'
+            for mes in range(1, 6)
+        )
+        results = self._run(body[:50], body[50:])
+        self.assertEqual([r['line'] for r in results], [1, 2, 3, 4, 5])
+        self.assertEqual([r['predict'] for r in results], [1, 0, 1, 0, 1])
+        self.assertEqual(self.calls, [2, 2, 1])
+
+    def test_invalid_lines(self):
+        """Invalid records get an error line and do not stop the stream."""
+        body = (
+            b'{"OPERA": "Grupo LATAM", "TIPOVUELO": "N", "MES": 3}\n'
+            b'not json\n'
+            b'\n'
+            b'{"OPERA": "Grupo LATAM", "TIPOVUELO": "N"}\n'
+            b'{"OPERA": "Sky Airline", "TIPOVUELO": "I", "MES": 4}\n'
+        )
+        results = self._run(body)
+        self.assertEqual([r['line'] for r in results], [1, 2, 4, 5])
+        self.assertEqual(results[0]['predict'], 1)
+        self.assertIn('error', results[1])
+        self.assertIn('error', results[2])
+        self.assertEqual(results[3]['predict'], 0)
+
+    def test_scoring_error(self):
+        """A failing chunk reports an error for each of its flights."""
+        def fail(flights):
+            raise ValueError("boom")
+
+        body = b'{"OPERA": "Grupo LATAM", "TIPOVUELO": "N", "MES": 3}\n'
+        lines = asyncio.run(_collect(stream_predictions(_chunks(body), Flight, fail)))
+        self.assertEqual(json.loads(lines[0]), {"line": 1, "error": "boom"})
+
+    @patch('challenge.api._score_flights')
+    def test_stream_endpoint(self, mock_score):
+        """The endpoint streams NDJSON predictions."""
+        mock_score.side_effect = lambda flights: [1] * len(flights)
+        body = (
+            '{"OPERA": "Grupo LATAM", "TIPOVUELO": "N", "MES": 3}\n'
+            '{"OPERA": "Sky Airline", "TIPOVUELO": "I", "MES": 7}\n'
+        )
+        with patch('challenge.api.stream_predictions', wraps=stream_predictions):
+            response = TestClient(app).post(
+                "/predict/stream", data=body, headers={"Content-Type": "application/x-ndjson"}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        self.assertEqual(
+            [json.loads(line) for line in response.text.splitlines()],
+            [{"line": 1, "predict": 1}, {"line": 2, "predict": 1}]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
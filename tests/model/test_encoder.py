@@ -0,0 +1,73 @@
+import unittest
+import pandas as pd
+import numpy as np
+from xgboost import XGBClassifier
+from challenge.model import DelayModel
+from challenge.encoder import InferenceEncoder
+
+
+class TestInferenceEncoder(unittest.TestCase):
+    def setUp(self):
+        """Fit the preprocessing pipeline on mock data."""
+        rng = np.random.RandomState(0)
+        self.model = DelayModel()
+        self.train = pd.DataFrame({
+            'OPERA': rng.choice(['Grupo LATAM', 'Sky Airline', 'Copa Air', 'Aerolineas Argentinas'], 500),
+            'TIPOVUELO': rng.choice(['I', 'N'], 500),
+            'MES': rng.randint(1, 13, 500),
+        })
+        self.target = pd.Series(rng.randint(0, 2, 500))
+        self.features = self.model.preprocess(self.train.copy(), fit=True)
+        self.flights = [
+            {'OPERA': 'Grupo LATAM', 'TIPOVUELO': 'I', 'MES': 12},
+            {'OPERA': 'Sky Airline', 'TIPOVUELO': 'N', 'MES': 7},
+            {'OPERA': 'Copa Air', 'TIPOVUELO': 'I', 'MES': 4},
+            {'OPERA': 'Unknown Airline', 'TIPOVUELO': 'N', 'MES': 1},
+        ]
+
+    def _pandas_path(self, flights):
+        return self.model.preprocess(pd.DataFrame(flights), fit=False).to_numpy()
+
+    def test_encode_matches_preprocess(self):
+        """encode gives the same matrix as preprocess(fit=False)."""
+        encoded = self.model.encode(self.flights)
+        self.assertEqual(encoded.dtype, np.float32)
+        self.assertEqual(encoded.shape, (len(self.flights), len(self.model._fitted_columns)))
+        np.testing.assert_array_equal(encoded, self._pandas_path(self.flights).astype(np.float32))
+
+    def test_encode_input_formats(self):
+        """Records, column dicts and DataFrames encode identically."""
+        expected = self.model.encode(self.flights)
+        columns = {col: [flight[col] for flight in self.flights] for col in ['OPERA', 'TIPOVUELO', 'MES']}
+        np.testing.assert_array_equal(self.model.encode(columns), expected)
+        np.testing.assert_array_equal(self.model.encode(pd.DataFrame(self.flights)), expected)
+
+    def test_encode_empty(self):
+        """An empty batch gives an empty matrix."""
+        self.assertEqual(self.model.encode([]).shape, (0, len(self.model._fitted_columns)))
+
+    def test_predictions_match(self):
+        """Model predictions on the encoded matrix match the pandas path."""
+        self.model._model = XGBClassifier(n_estimators=20, max_depth=3, random_state=42)
+        self.model._model.fit(self.features, self.target)
+        np.testing.assert_array_equal(
+            self.model._model.predict_proba(self.model.encode(self.train)),
+            self.model._model.predict_proba(self.model.preprocess(self.train.copy(), fit=False))
+        )
+
+    def test_encoder_reset_on_fit(self):
+        """Refitting the pipeline recompiles the encoder."""
+        encoder = self.model.get_encoder()
+        self.assertIsInstance(encoder, InferenceEncoder)
+        self.assertIs(self.model.get_encoder(), encoder)
+        self.model.preprocess(self.train.copy(), fit=True)
+        self.assertIsNot(self.model.get_encoder(), encoder)
+
+    def test_encode_without_fit(self):
+        """encode fails before the pipeline is fitted."""
+        with self.assertRaises(ValueError):
+            DelayModel().encode(self.flights)
+
+
+if __name__ == '__main__':
+    unittest.main()
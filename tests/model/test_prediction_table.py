@@ -0,0 +1,69 @@
+import unittest
+import pandas as pd
+import numpy as np
+from xgboost import XGBClassifier
+from challenge.model import DelayModel
+from challenge.prediction_table import PredictionTable, known_airlines
+
+
+class TestPredictionTable(unittest.TestCase):
+    def setUp(self):
+        """Fit a small model on mock data without writing artifacts."""
+        rng = np.random.RandomState(0)
+        self.model = DelayModel()
+        data = pd.DataFrame({
+            'OPERA': rng.choice(['Grupo LATAM', 'Sky Airline', 'Copa Air', 'Aerolineas Argentinas'], 400),
+            'TIPOVUELO': rng.choice(['I', 'N'], 400),
+            'MES': rng.randint(1, 13, 400),
+        })
+        target = pd.Series(rng.randint(0, 2, 400))
+        features = self.model.preprocess(data, fit=True)
+        self.model._model = XGBClassifier(n_estimators=20, max_depth=3, random_state=42)
+        self.model._model.fit(features, target)
+        self.table = PredictionTable(self.model).build()
+
+    def _pipeline(self, flights):
+        features = self.model.preprocess(pd.DataFrame(flights), fit=False)
+        return self.model._model.predict(features).tolist()
+
+    def test_known_airlines(self):
+        """Airlines are taken from the fitted OPERA_ columns."""
+        self.assertEqual(
+            set(known_airlines(self.model)),
+            {'Latin American Wings', 'Grupo LATAM', 'Sky Airline', 'Copa Air'}
+        )
+
+    def test_build_enumerates_space(self):
+        """Every airline x type x month combination is in the table."""
+        self.assertEqual(len(self.table), 4 * 2 * 12)
+        self.assertIn(('Sky Airline', 'I', 7), self.table)
+
+    def test_verify(self):
+        """The table matches the full pipeline row by row."""
+        self.table.verify()
+
+    def test_verify_mismatch(self):
+        """A corrupted entry is detected at verification."""
+        key = ('Copa Air', 'N', 3)
+        self.table._table[key] = 1 - self.table._table[key]
+        with self.assertRaises(ValueError):
+            self.table.verify()
+
+    def test_predict_matches_pipeline(self):
+        """Lookups and fallbacks give the same answers as the pipeline."""
+        flights = [
+            {'OPERA': 'Grupo LATAM', 'TIPOVUELO': 'I', 'MES': 12},
+            {'OPERA': 'Aerolineas Argentinas', 'TIPOVUELO': 'N', 'MES': 3},
+            {'OPERA': 'Sky Airline', 'TIPOVUELO': 'N', 'MES': 7},
+            {'OPERA': 'Unknown Airline', 'TIPOVUELO': 'I', 'MES': 10},
+        ]
+        expected = [self._pipeline([flight])[0] for flight in flights]
+        self.assertEqual(self.table.predict(flights), expected)
+
+    def test_predict_empty(self):
+        """An empty batch returns an empty list."""
+        self.assertEqual(self.table.predict([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import json
+import os
+import tempfile
+import pandas as pd
+import numpy as np
+from xgboost import XGBClassifier
+from challenge.model import DelayModel
+from challenge.tree_evaluator import CompiledBooster
+
+
+class TestCompiledBooster(unittest.TestCase):
+    def setUp(self):
+        """Train a small but non-trivial booster on synthetic one-hot data."""
+        rng = np.random.RandomState(0)
+        self.features = rng.randint(0, 2, (2000, 10)).astype(np.float32) * rng.randn(10).astype(np.float32)
+        logits = 2 * self.features[:, 1] - self.features[:, 3] + rng.randn(2000)
+        self.target = (logits > 0.5).astype(int)
+        self.xgb = XGBClassifier(n_estimators=50, max_depth=5, learning_rate=0.2, random_state=42)
+        self.xgb.fit(self.features, self.target)
+        self.compiled = CompiledBooster.from_booster(self.xgb.get_booster())
+
+    def test_predict_proba_matches_xgboost(self):
+        """Probabilities match XGBoost's own predict_proba."""
+        np.testing.assert_allclose(
+            self.compiled.predict_proba(self.features),
+            self.xgb.predict_proba(self.features),
+            rtol=0, atol=1e-6
+        )
+
+    def test_predict_matches_xgboost(self):
+        """Classes match XGBoost's own predict, including single rows."""
+        np.testing.assert_array_equal(self.compiled.predict(self.features), self.xgb.predict(self.features))
+        np.testing.assert_array_equal(self.compiled.predict(self.features[:1]), self.xgb.predict(self.features[:1]))
+
+    def test_missing_values(self):
+        """NaN follows each split's default direction like XGBoost."""
+        features = self.features.copy()
+        features[::7, 1] = np.nan
+        np.testing.assert_allclose(
+            self.compiled.predict_proba(features),
+            self.xgb.predict_proba(features),
+            rtol=0, atol=1e-6
+        )
+
+    def test_from_json(self):
+        """Compiling from a saved JSON file gives the same evaluator."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'model.json')
+            self.xgb.save_model(path)
+            compiled = CompiledBooster.from_json(path)
+        self.assertEqual(compiled.n_trees, self.compiled.n_trees)
+        np.testing.assert_array_equal(compiled.predict_margin(self.features), self.compiled.predict_margin(self.features))
+
+    def test_wrong_shape(self):
+        """A matrix with the wrong number of features is rejected."""
+        with self.assertRaises(ValueError):
+            self.compiled.predict(np.zeros((2, 3), dtype=np.float32))
+
+    def test_unsupported_objective(self):
+        """Non-logistic objectives are rejected."""
+        model = json.loads(bytes(self.xgb.get_booster().save_raw('json')))
+        model['learner']['objective']['name'] = 'reg:squarederror'
+        with self.assertRaises(ValueError):
+            CompiledBooster(model)
+
+
+class TestDelayModelScoringBackend(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(1)
+        self.model = DelayModel(scoring_backend='compiled', compiled_max_rows=10)
+        data = pd.DataFrame({
+            'OPERA': rng.choice(['Grupo LATAM', 'Sky Airline', 'Copa Air'], 300),
+            'TIPOVUELO': rng.choice(['I', 'N'], 300),
+            'MES': rng.randint(1, 13, 300),
+        })
+        target = pd.Series(rng.randint(0, 2, 300))
+        self.features = self.model.preprocess(data, fit=True)
+        self.model._model = XGBClassifier(n_estimators=20, max_depth=3, random_state=42)
+        self.model._model.fit(self.features, target)
+
+    def test_compiled_backend(self):
+        """Small batches go through the compiled evaluator."""
+        preds = self.model.predict(self.features.iloc[:5])
+        self.assertIsNotNone(self.model._compiled)
+        np.testing.assert_array_equal(preds, self.model._model.predict(self.features.iloc[:5]))
+
+    def test_large_batch_uses_xgboost(self):
+        """Batches above compiled_max_rows stay on XGBoost."""
+        preds = self.model.predict(self.features)
+        self.assertIsNone(self.model._compiled)
+        np.testing.assert_array_equal(preds, self.model._model.predict(self.features))
+
+    def test_unknown_backend(self):
+        """Unknown backends are rejected."""
+        with self.assertRaises(ValueError):
+            self.model.set_scoring_backend('onnx')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,17 @@
 import unittest
+import numpy as np
 import pandas as pd
-from utils.utils import get_period_day, is_high_season, get_min_diff, delay
+from utils.utils import (
+    get_period_day,
+    is_high_season,
+    get_min_diff,
+    delay,
+    get_period_day_array,
+    is_high_season_array,
+    get_min_diff_array,
+    delay_array,
+    date_features
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -72,6 +83,48 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(delay('invalid', threshold=15), 0)
         self.assertEqual(delay(None, threshold=15), 0)
 
+    def test_period_day_boundaries(self):
+        """Test get_period_day on the seconds past each minute bound."""
+        self.assertEqual(get_period_day('2024-06-01 11:59:00'), 'mañana')
+        self.assertEqual(get_period_day('2024-06-01 11:59:30'), 'desconocido')
+        self.assertEqual(get_period_day('2024-06-01 04:59:59'), 'desconocido')
+
+    def test_high_season_boundaries(self):
+        """Test is_high_season against the midnight of each bound."""
+        self.assertEqual(is_high_season('2024-12-31 00:00:00'), 1)
+        self.assertEqual(is_high_season('2024-12-31 10:00:00'), 0)
+        self.assertEqual(is_high_season('2024-03-03 00:00:01'), 0)
+        self.assertEqual(is_high_season(pd.Timestamp('2024-12-20')), 0)
+
+    def test_array_functions(self):
+        """Test the column-wise helpers, including malformed rows."""
+        fecha_i = pd.Series(['2024-06-01 06:30:00', '2024-12-20 20:00:00', 'invalid-date', None])
+        fecha_o = pd.Series(['2024-06-01 06:50:00', '2024-12-20 20:10:00', '2024-06-01 14:00:00', None])
+        self.assertEqual(list(get_period_day_array(fecha_i)), ['mañana', 'noche', 'error', 'error'])
+        self.assertEqual(list(is_high_season_array(fecha_i)), [0, 1, 0, 0])
+        self.assertEqual(list(get_min_diff_array(fecha_o, fecha_i)), [20.0, 10.0, 0.0, 0.0])
+        self.assertEqual(list(delay_array(pd.Series([20.0, 10.0, np.nan]))), [1, 0, 0])
+        self.assertEqual(list(delay_array([20, 'invalid', None])), [1, 0, 0])
+
+    def test_date_features_matches_scalar(self):
+        """Test date_features against the scalar helpers row by row."""
+        data = pd.DataFrame({
+            'Fecha-I': ['2024-01-02 05:00:00', '2024-07-31 00:00:00', '2024-09-11 19:30:00', '2024-6-1 3:0:0', 'bad'],
+            'Fecha-O': ['2024-01-02 05:20:00', '2024-07-30 23:50:00', 'bad', '2024-06-01 03:16:00', '2024-01-01 00:00:00']
+        })
+        features = date_features(data['Fecha-I'], data['Fecha-O'])
+        self.assertEqual(list(features['period_day']), [get_period_day(d) for d in data['Fecha-I']])
+        self.assertEqual(list(features['high_season']), [is_high_season(d) for d in data['Fecha-I']])
+        self.assertEqual(list(features['min_diff']), [get_min_diff(row) for _, row in data.iterrows()])
+
+    def test_date_features_with_timestamps(self):
+        """Test date_features on a datetime column without Fecha-O."""
+        fecha_i = pd.Series(pd.date_range('2024-01-01', periods=4, freq='7h'))
+        features = date_features(fecha_i)
+        self.assertEqual(list(features['period_day']), ['noche', 'mañana', 'tarde', 'noche'])
+        self.assertEqual(list(features['high_season']), [0, 0, 0, 0])
+        self.assertEqual(list(features['min_diff']), [0.0, 0.0, 0.0, 0.0])
+
 
 if __name__ == '__main__':
     unittest.main()
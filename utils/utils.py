@@ -1,82 +1,221 @@
-from datetime import datetime
 import numpy as np
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# period_day bounds in seconds since midnight, both ends inclusive at the
+# minute resolution of the original bounds (11:59:30 is not 'mañana').
+MORNING_RANGE = (5 * 3600, 11 * 3600 + 59 * 60)
+AFTERNOON_RANGE = (12 * 3600, 18 * 3600 + 59 * 60)
+EVENING_RANGE = (19 * 3600, 23 * 3600 + 59 * 60)
+NIGHT_RANGE = (0, 4 * 3600 + 59 * 60)
+
+# High season ranges as inclusive (month, day) pairs, compared against midnight
+# of each bound (31-Dec at 10:00 is already outside the range).
+HIGH_SEASON_RANGES = [
+    ((12, 15), (12, 31)),
+    ((1, 1), (3, 3)),
+    ((7, 15), (7, 31)),
+    ((9, 11), (9, 30)),
+]
+
+
+def _as_object_array(values) -> np.ndarray:
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=object)
+    return np.asarray(values, dtype=object).reshape(-1)
+
+
+def _is_str_mask(raw: np.ndarray) -> np.ndarray:
+    # Fast path: all-string columns (the normal CSV case)
+    if pd.api.types.infer_dtype(raw, skipna=False) == 'string':
+        return np.ones(len(raw), dtype=bool)
+    return np.fromiter((isinstance(v, str) for v in raw), dtype=bool, count=len(raw))
+
+
+def parse_dates(values, allow_timestamps: bool = False) -> pd.Series:
+    """
+    Parse a column of 'YYYY-MM-DD HH:MM:SS' strings in a single vectorized pass.
+    Anything that is not a valid string (or a pd.Timestamp when allow_timestamps
+    is set) becomes NaT, matching the rows the scalar helpers reject.
+    """
+    if isinstance(values, pd.Series) and pd.api.types.is_datetime64_any_dtype(values.dtype):
+        if not allow_timestamps:
+            return pd.Series(pd.NaT, index=range(len(values)), dtype='datetime64[ns]')
+        dates = values.reset_index(drop=True)
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        return dates.dt.floor('s').astype('datetime64[ns]')
+
+    raw = _as_object_array(values)
+    is_str = _is_str_mask(raw)
+    dates = pd.to_datetime(
+        pd.Series(np.where(is_str, raw, None), dtype=object),
+        format=DATE_FORMAT,
+        errors='coerce'
+    ).astype('datetime64[ns]')
+
+    if allow_timestamps:
+        is_ts = np.fromiter(
+            (isinstance(v, pd.Timestamp) for v in raw), dtype=bool, count=len(raw)
+        )
+        for i in np.flatnonzero(is_ts):
+            # Same as the scalar helper: format and re-parse (drops tz and fractions)
+            dates.iloc[i] = pd.Timestamp(raw[i].strftime(DATE_FORMAT))
+    return dates
+
+
+def _log_malformed(name: str, values, mask: np.ndarray) -> None:
+    n_bad = int(mask.sum())
+    if n_bad:
+        example = _as_object_array(values)[np.argmax(mask)]
+        logger.error(f"Error in {name}: {n_bad} malformed value(s), e.g. {example!r}")
+
+
+def _seconds_of_day(dates: pd.Series) -> np.ndarray:
+    hours = dates.dt.hour.to_numpy(dtype=float)
+    minutes = dates.dt.minute.to_numpy(dtype=float)
+    return hours * 3600 + minutes * 60 + dates.dt.second.to_numpy(dtype=float)
+
+
+def period_day_from_dates(dates: pd.Series) -> np.ndarray:
+    """
+    Vectorized period_day over already parsed dates (NaT -> 'error').
+    """
+    seconds = _seconds_of_day(dates)
+
+    def between(bounds):
+        return (seconds >= bounds[0]) & (seconds <= bounds[1])
+
+    return np.select(
+        [
+            dates.isna().to_numpy(),
+            between(MORNING_RANGE),
+            between(AFTERNOON_RANGE),
+            between(EVENING_RANGE) | between(NIGHT_RANGE),
+        ],
+        ['error', 'mañana', 'tarde', 'noche'],
+        default='desconocido'
+    ).astype(object)
+
+
+def high_season_from_dates(dates: pd.Series) -> np.ndarray:
+    """
+    Vectorized high_season over already parsed dates (NaT -> 0).
+    """
+    # Sortable key within the year: (month, day, seconds) packed into one number
+    month_day = dates.dt.month.to_numpy(dtype=float) * 32 + dates.dt.day.to_numpy(dtype=float)
+    key = month_day * 86400 + _seconds_of_day(dates)
+    in_season = np.zeros(len(dates), dtype=bool)
+    for (min_month, min_day), (max_month, max_day) in HIGH_SEASON_RANGES:
+        low = (min_month * 32 + min_day) * 86400
+        high = (max_month * 32 + max_day) * 86400
+        in_season |= (key >= low) & (key <= high)
+    return in_season.astype(np.int64)
+
+
+def min_diff_from_dates(fecha_o: pd.Series, fecha_i: pd.Series) -> np.ndarray:
+    """
+    Vectorized min_diff over already parsed dates (any NaT -> 0.0).
+    """
+    diff = (fecha_o.to_numpy() - fecha_i.to_numpy()) / np.timedelta64(1, 'm')
+    return np.where(np.isnan(diff), 0.0, diff).astype(np.float64)
+
+
+def get_period_day_array(dates) -> np.ndarray:
+    """
+    Column-wise get_period_day.
+    """
+    parsed = parse_dates(dates, allow_timestamps=True)
+    _log_malformed('get_period_day', dates, parsed.isna().to_numpy())
+    return period_day_from_dates(parsed)
+
+
+def is_high_season_array(fechas) -> np.ndarray:
+    """
+    Column-wise is_high_season.
+    """
+    parsed = parse_dates(fechas)
+    _log_malformed('is_high_season', fechas, parsed.isna().to_numpy())
+    return high_season_from_dates(parsed)
+
+
+def get_min_diff_array(fecha_o, fecha_i) -> np.ndarray:
+    """
+    Column-wise get_min_diff.
+    """
+    parsed_o = parse_dates(fecha_o)
+    parsed_i = parse_dates(fecha_i)
+    _log_malformed('get_min_diff', fecha_o, (parsed_o.isna() | parsed_i.isna()).to_numpy())
+    return min_diff_from_dates(parsed_o, parsed_i)
+
+
+def delay_array(min_diff, threshold: int = 15) -> np.ndarray:
+    """
+    Column-wise delay. Non-numeric values are not delayed (0).
+    """
+    if isinstance(min_diff, pd.Series) and pd.api.types.is_numeric_dtype(min_diff.dtype):
+        values = min_diff.to_numpy(dtype=float)
+    else:
+        raw = _as_object_array(min_diff)
+        is_num = np.fromiter(
+            (isinstance(v, (int, float, np.number)) for v in raw), dtype=bool, count=len(raw)
+        )
+        values = np.where(is_num, raw, np.nan).astype(float)
+    with np.errstate(invalid='ignore'):
+        return (values > threshold).astype(np.int64)
+
+
+def date_features(fecha_i, fecha_o=None) -> pd.DataFrame:
+    """
+    Derive period_day, high_season and min_diff parsing each date column once.
+    Without fecha_o, min_diff is 0.0 (as get_min_diff does for missing columns).
+    """
+    parsed_i = parse_dates(fecha_i, allow_timestamps=True)
+    # is_high_season and get_min_diff only accept strings
+    is_str = _is_str_mask(_as_object_array(fecha_i))
+    parsed_i_str = parsed_i.where(is_str)
+
+    if fecha_o is not None:
+        min_diff = min_diff_from_dates(parse_dates(fecha_o), parsed_i_str)
+    else:
+        min_diff = np.zeros(len(parsed_i), dtype=np.float64)
+
+    _log_malformed('date_features', fecha_i, parsed_i.isna().to_numpy())
+    return pd.DataFrame({
+        'period_day': period_day_from_dates(parsed_i),
+        'high_season': high_season_from_dates(parsed_i_str),
+        'min_diff': min_diff,
+    })
+
+
 def get_period_day(date: str) -> str:
     """
     Classify the time of day into 'mañana', 'tarde', or 'noche'.
     """
-    if isinstance(date, pd.Timestamp):
-        date = date.strftime('%Y-%m-%d %H:%M:%S')
-    try:
-        date_time = datetime.strptime(date, '%Y-%m-%d %H:%M:%S').time()
-        morning_min = datetime.strptime("05:00", '%H:%M').time()
-        morning_max = datetime.strptime("11:59", '%H:%M').time()
-        afternoon_min = datetime.strptime("12:00", '%H:%M').time()
-        afternoon_max = datetime.strptime("18:59", '%H:%M').time()
-        evening_min = datetime.strptime("19:00", '%H:%M').time()
-        evening_max = datetime.strptime("23:59", '%H:%M').time()
-        night_min = datetime.strptime("00:00", '%H:%M').time()
-        night_max = datetime.strptime("04:59", '%H:%M').time()
-        
-        if morning_min <= date_time <= morning_max:
-            return 'mañana'
-        elif afternoon_min <= date_time <= afternoon_max:
-            return 'tarde'
-        elif evening_min <= date_time <= evening_max or night_min <= date_time <= night_max:
-            return 'noche'
-        return 'desconocido'
-    except Exception as e:
-        logger.error(f"Error in get_period_day with date: {date} - {e}")
-        return 'error'
+    return get_period_day_array([date])[0]
 
 def is_high_season(fecha: str) -> int:
     """
     Determine if a date is in the high season.
     """
-    try:
-        fecha_año = int(fecha.split('-')[0])
-        fecha = datetime.strptime(fecha, '%Y-%m-%d %H:%M:%S')
-        range1_min = datetime.strptime('15-Dec', '%d-%b').replace(year=fecha_año)
-        range1_max = datetime.strptime('31-Dec', '%d-%b').replace(year=fecha_año)
-        range2_min = datetime.strptime('1-Jan', '%d-%b').replace(year=fecha_año)
-        range2_max = datetime.strptime('3-Mar', '%d-%b').replace(year=fecha_año)
-        range3_min = datetime.strptime('15-Jul', '%d-%b').replace(year=fecha_año)
-        range3_max = datetime.strptime('31-Jul', '%d-%b').replace(year=fecha_año)
-        range4_min = datetime.strptime('11-Sep', '%d-%b').replace(year=fecha_año)
-        range4_max = datetime.strptime('30-Sep', '%d-%b').replace(year=fecha_año)
-        
-        if ((range1_min <= fecha <= range1_max) or 
-            (range2_min <= fecha <= range2_max) or 
-            (range3_min <= fecha <= range3_max) or
-            (range4_min <= fecha <= range4_max)):
-            return 1
-        return 0
-    except Exception as e:
-        logger.error(f"Error in is_high_season with date: {fecha} - {e}")
-        return 0
+    return int(is_high_season_array([fecha])[0])
 
 def get_min_diff(row: pd.Series) -> float:
     """
     Calculate the difference in minutes between two datetime columns.
     """
-    try:
-        fecha_o = datetime.strptime(row['Fecha-O'], '%Y-%m-%d %H:%M:%S')
-        fecha_i = datetime.strptime(row['Fecha-I'], '%Y-%m-%d %H:%M:%S')
-        return (fecha_o - fecha_i).total_seconds() / 60
-    except Exception as e:
-        logger.error(f"Error in get_min_diff with row: {row.to_dict()} - {e}")
-        return 0.0
+    return float(get_min_diff_array([row.get('Fecha-O')], [row.get('Fecha-I')])[0])
 
 def delay(min_diff: float, threshold: int = 15) -> int:
     """
     Determine if a flight is delayed based on a time threshold.
     """
     try:
-        return 1 if min_diff > threshold else 0
+        return int(delay_array([min_diff], threshold=threshold)[0])
     except Exception as e:
         logger.error(f"Error in delay with min_diff: {min_diff}, threshold: {threshold} - {e}")
         return 0